@@ -17,6 +17,7 @@ setuptools.setup(
     keywords=['alarm', 'Yale', 'Smart Alarm'],
     package_data={'': ['data/*.json']},
     install_requires=['requests>=2.0.0','backoff>=1.10.0'],
+    extras_require={'orjson': ['orjson>=3.0.0']},
     packages=setuptools.find_packages(),
     include_package_data=True,
     zip_safe=False,
@@ -0,0 +1,135 @@
+"""Tests for the Yale authentication module."""
+import threading
+import time
+from typing import Any, List
+
+import pytest
+import requests
+
+from yalesmartalarmclient.auth import YaleAuth, _parse_json
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(
+        self, status_code: int, data: Any = None, content: bytes = b""
+    ) -> None:
+        self.status_code = status_code
+        self._data = data
+        self.content = content
+
+    def json(self) -> Any:
+        return self._data
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(response=self)  # type: ignore[arg-type]
+
+
+@pytest.fixture
+def auth(monkeypatch: pytest.MonkeyPatch) -> YaleAuth:
+    """Return a YaleAuth that logged in without touching the network."""
+
+    def fake_authorize(self: YaleAuth) -> None:
+        self.access_token = "token-1"
+        self.refresh_token = "refresh"
+
+    monkeypatch.setattr(YaleAuth, "_authorize", fake_authorize)
+    monkeypatch.setattr("yalesmartalarmclient.auth.orjson", None)
+    return YaleAuth(username="user", password="pass")
+
+
+def test_concurrent_expired_token_authorizes_once(auth: YaleAuth) -> None:
+    """Threads hitting an expired token share a single re-authorization."""
+    authorizations: List[str] = []
+    barrier = threading.Barrier(8)
+
+    def authorize() -> None:
+        authorizations.append("authorize")
+        auth.access_token = "token-2"
+
+    def get(url: str, headers: Any, timeout: int) -> FakeResponse:
+        if headers["Authorization"] == "Bearer token-1":
+            barrier.wait(timeout=5)
+            return FakeResponse(401)
+        return FakeResponse(200, {"data": "ok"})
+
+    auth._authorize = authorize  # type: ignore[assignment]
+    auth.session.get = get  # type: ignore[assignment]
+
+    threads = [
+        threading.Thread(target=auth.get_authenticated, args=("/api/panel/mode/",))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert authorizations == ["authorize"]
+
+
+def test_server_error_is_retried_without_login(
+    auth: YaleAuth, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A 5xx is retried by the outer backoff and does not force a new login."""
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    authorizations: List[str] = []
+    responses = [FakeResponse(503), FakeResponse(503), FakeResponse(200, {"a": 1})]
+
+    auth._authorize = lambda: authorizations.append("authorize")  # type: ignore
+    auth.session.get = lambda *args, **kwargs: responses.pop(0)  # type: ignore
+
+    assert auth.get_authenticated("/api/panel/mode/") == {"a": 1}
+    assert responses == []
+    assert authorizations == []
+
+
+@pytest.mark.parametrize(
+    "failure", [requests.ReadTimeout(), requests.HTTPError(response=FakeResponse(503))]
+)
+def test_post_not_resent_after_reaching_server(
+    auth: YaleAuth, monkeypatch: pytest.MonkeyPatch, failure: Exception
+) -> None:
+    """A POST the panel may have acted on is not sent again."""
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    posts: List[str] = []
+
+    def post(*args: Any, **kwargs: Any) -> FakeResponse:
+        posts.append("post")
+        raise failure
+
+    auth.session.post = post  # type: ignore[assignment]
+    with pytest.raises(type(failure)):
+        auth.post_authenticated("/api/panel/panic")
+    assert posts == ["post"]
+
+
+def test_post_retried_when_connection_failed(
+    auth: YaleAuth, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    responses: List[Any] = [requests.ConnectionError(), FakeResponse(200, {"a": 1})]
+
+    def post(*args: Any, **kwargs: Any) -> FakeResponse:
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response  # type: ignore[no-any-return]
+
+    auth.session.post = post  # type: ignore[assignment]
+    assert auth.post_authenticated("/api/panel/mode/") == {"a": 1}
+    assert responses == []
+
+
+def test_parse_json_decodes_with_orjson() -> None:
+    pytest.importorskip("orjson")
+    response = FakeResponse(200, data="from json()", content=b'{"data": [1, 2]}')
+    assert _parse_json(response) == {"data": [1, 2]}  # type: ignore[arg-type]
+
+
+def test_parse_json_falls_back_on_malformed_body() -> None:
+    pytest.importorskip("orjson")
+    response = FakeResponse(200, data="from json()", content=b"<html>")
+    assert _parse_json(response) == "from json()"  # type: ignore[arg-type]
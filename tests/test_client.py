@@ -0,0 +1,204 @@
+"""Tests for the Yale Smart Alarm client."""
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import pytest
+import requests
+
+from yalesmartalarmclient.client import (
+    YALE_STATE_ARM_FULL,
+    YALE_STATE_DISARM,
+    YaleSmartAlarmClient,
+)
+from yalesmartalarmclient.exceptions import AuthenticationError
+
+
+class FakeAuth:
+    """Stand-in for YaleAuth serving canned panel responses."""
+
+    def __init__(self) -> None:
+        self.mode = YALE_STATE_DISARM
+        self.calls: List[str] = []
+        self.on_get_mode: Optional[Any] = None
+
+    def get_authenticated(self, endpoint: str) -> Dict[str, Any]:
+        self.calls.append(endpoint)
+        if endpoint == YaleSmartAlarmClient._ENDPOINT_CYCLE:
+            return {"data": {}}
+        if endpoint == YaleSmartAlarmClient._ENDPOINT_GET_MODE:
+            response = {"data": [{"mode": self.mode}]}
+            if self.on_get_mode is not None:
+                # Simulate a state change landing while this response is in flight.
+                on_get_mode, self.on_get_mode = self.on_get_mode, None
+                on_get_mode()
+            return response
+        return {
+            "data": [
+                {
+                    "type": "device_type.door_lock",
+                    "name": "frontdoor",
+                    "status1": "device_status.lock",
+                    "minigw_lock_status": "",
+                },
+                {
+                    "type": "device_type.door_contact",
+                    "name": "backdoor",
+                    "status1": "device_status.dc_open",
+                },
+                {
+                    "type": "device_type.door_contact",
+                    "status1": "device_status.dc_close",
+                },
+            ]
+        }
+
+    def post_authenticated(
+        self, endpoint: str, params: Optional[Dict[Any, Any]] = None
+    ) -> Dict[str, Any]:
+        if params is not None:
+            self.mode = params["mode"]
+        return {"code": "000"}
+
+
+@pytest.fixture
+def auth() -> FakeAuth:
+    return FakeAuth()
+
+
+@pytest.fixture
+def client(auth: FakeAuth) -> YaleSmartAlarmClient:
+    client = YaleSmartAlarmClient("user", "pass", cache_ttl=60, lazy_login=True)
+    client._auth = auth  # type: ignore[assignment]
+    return client
+
+
+def test_status_is_cached(client: YaleSmartAlarmClient, auth: FakeAuth) -> None:
+    assert client.get_locks_status() == {"frontdoor": "locked"}
+    assert client.get_doors_status() == {"backdoor": "open"}
+    assert auth.calls.count(YaleSmartAlarmClient._ENDPOINT_DEVICES_STATUS) == 1
+
+
+def test_read_during_arm_is_not_cached(
+    client: YaleSmartAlarmClient, auth: FakeAuth
+) -> None:
+    """A read racing the arm request must not cache the pre-change mode."""
+    auth.on_get_mode = client.arm_full
+    assert not client.is_armed()
+    assert auth.mode == YALE_STATE_ARM_FULL
+    assert client.is_armed()
+
+
+def test_arm_between_check_and_cache_write_is_not_cached(
+    client: YaleSmartAlarmClient, auth: FakeAuth
+) -> None:
+    """An arm landing after the generation check must still drop the response."""
+    arm = threading.Thread(target=client.arm_full)
+
+    class ArmBeforeWrite(dict):  # type: ignore[type-arg]
+        def __setitem__(self, key: str, value: Any) -> None:
+            if (
+                key == YaleSmartAlarmClient._ENDPOINT_GET_MODE
+                and not arm.is_alive()
+                and auth.mode != YALE_STATE_ARM_FULL
+            ):
+                arm.start()
+                # Let the arm finish unless the cache write holds it off.
+                arm.join(timeout=0.2)
+            super().__setitem__(key, value)
+
+    client._cache = ArmBeforeWrite()
+    assert not client.is_armed()
+    arm.join()
+    assert client.is_armed()
+
+
+def test_returned_devices_do_not_alias_cache(client: YaleSmartAlarmClient) -> None:
+    client.get_all_devices().clear()
+    assert len(client.get_all_devices()) == 3
+
+
+def test_snapshot_falls_back_when_cycle_fails(
+    client: YaleSmartAlarmClient, auth: FakeAuth
+) -> None:
+    get_authenticated = auth.get_authenticated
+
+    def failing_cycle(endpoint: str) -> Dict[str, Any]:
+        if endpoint == YaleSmartAlarmClient._ENDPOINT_CYCLE:
+            raise AuthenticationError
+        return get_authenticated(endpoint)
+
+    auth.get_authenticated = failing_cycle  # type: ignore[assignment]
+    assert client.get_locks_status() == {"frontdoor": "locked"}
+    assert client.get_armed_status() == YALE_STATE_DISARM
+    assert client._snapshot_supported is False
+
+
+class StopAfterOnePoll(threading.Event):
+    """Stop event ending _poll after its first iteration."""
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        self.set()
+        return True
+
+
+def test_polling_serves_reads_until_stopped(
+    client: YaleSmartAlarmClient, auth: FakeAuth
+) -> None:
+    client.start_polling(interval=60)
+    deadline = time.monotonic() + 5
+    while client._get_polled() is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    calls = len(auth.calls)
+    client._cache.clear()
+
+    assert client.get_locks_status() == {"frontdoor": "locked"}
+    assert client.get_doors_status() == {"backdoor": "open"}
+    assert not client.is_armed()
+    assert len(auth.calls) == calls
+
+    client.get_locks_status().clear()
+    client.get_doors_status().clear()
+    assert client.get_locks_status() == {"frontdoor": "locked"}
+    assert client.get_doors_status() == {"backdoor": "open"}
+
+    client.stop_polling()
+    assert client._poll_thread is None
+    assert client._get_polled() is None
+
+
+def test_poll_racing_arm_is_discarded(
+    client: YaleSmartAlarmClient, auth: FakeAuth
+) -> None:
+    """A poll fetched before arming must not store the pre-change state."""
+    auth.on_get_mode = client.arm_full
+    client._poll(60, StopAfterOnePoll())
+    assert client._get_polled() is None
+    assert client.is_armed()
+
+
+def test_outdated_poll_falls_back_to_api(
+    client: YaleSmartAlarmClient, auth: FakeAuth
+) -> None:
+    client._poll_interval = 1
+    client._polled = (time.monotonic() - 10, {}, {}, YALE_STATE_ARM_FULL)
+    assert not client.is_armed()
+    assert auth.calls[-1] == YaleSmartAlarmClient._ENDPOINT_GET_MODE
+
+
+def test_snapshot_probe_retried_after_transient_error(
+    client: YaleSmartAlarmClient, auth: FakeAuth
+) -> None:
+    get_authenticated = auth.get_authenticated
+    failures = [requests.Timeout()]
+
+    def flaky_cycle(endpoint: str) -> Dict[str, Any]:
+        if endpoint == YaleSmartAlarmClient._ENDPOINT_CYCLE and failures:
+            raise failures.pop()
+        return get_authenticated(endpoint)
+
+    auth.get_authenticated = flaky_cycle  # type: ignore[assignment]
+    with pytest.raises(requests.Timeout):
+        client.get_locks_status()
+    assert client._snapshot_supported is None
+    assert client.get_locks_status() == {"frontdoor": "locked"}
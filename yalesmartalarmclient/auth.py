@@ -1,15 +1,33 @@
 """Module for handling authentication against the Yale Smart API."""
 import logging
+import threading
 from typing import Any, Dict, Literal, Optional, Tuple, Union, cast
 
 import backoff
 import requests
+from requests.adapters import HTTPAdapter
 
 from .exceptions import AuthenticationError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 _LOGGER = logging.getLogger(__name__)
 
 
+def _parse_json(response: requests.Response) -> Any:
+    """Decode a JSON response, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # Let requests raise its usual error for the malformed body.
+            pass
+    return response.json()
+
+
 class YaleAuth:
     """Handle authentication and creating authorized calls on the yale apis."""
 
@@ -24,17 +42,19 @@ class YaleAuth:
     _YALE_AUTHENTICATION_ACCESS_TOKEN = "access_token"
 
     _DEFAULT_REQUEST_TIMEOUT = 5
+    _POOL_CONNECTIONS = 4
+    _POOL_MAXSIZE = 10
     _MAX_RETRY_SECONDS = 30
     _MAX_TRIES = 5
 
     @staticmethod
     def _give_up(e: requests.exceptions.RequestException) -> bool:
-        """Give up on connecting."""
-        try:
-            status = e.response.status_code
-            # if e.response.status_code == 401:
-            #    raise AuthenticationError
-        except requests.RequestException:
+        """Give up on connecting.
+
+        Connection errors, timeouts and server errors are transient and retried,
+        any other HTTP error means the request was refused.
+        """
+        if e.response is None or e.response.status_code >= 500:
             return False
         raise AuthenticationError
 
@@ -46,14 +66,49 @@ class YaleAuth:
         "giveup": _give_up,
     }
 
+    @staticmethod
+    def _give_up_post(e: requests.exceptions.RequestException) -> bool:
+        """Give up on a POST unless it never reached the server.
+
+        Requests such as arming, the panic button or unlocking are not resent
+        after a timeout or server error, the panel may already have acted on them.
+        """
+        if e.response is not None and e.response.status_code < 500:
+            raise AuthenticationError
+        return not isinstance(e, requests.exceptions.ConnectionError)
+
+    BACKOFF_POST_RETRY_ON_EXCEPTION_PARAMS = {
+        **BACKOFF_RETRY_ON_EXCEPTION_PARAMS,
+        "giveup": _give_up_post,
+    }
+
     def __init__(self, username: str, password: str) -> None:
-        """Initialize Authentication module."""
+        """Initialize Authentication module.
+
+        The instance may be shared between threads, re-authorization is
+        serialized so only one of them refreshes an expired token.
+        """
         self.username = username
         self.password = password
         self.refresh_token: Optional[str] = None
         self.access_token: Optional[str] = None
+        self._urls: Dict[str, str] = {}
+        # Serialize re-authorization between threads sharing this instance.
+        self._auth_lock = threading.RLock()
+        # Share one pooled session so consecutive calls reuse the TLS connection.
+        self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=self._POOL_CONNECTIONS,
+                pool_maxsize=self._POOL_MAXSIZE,
+                max_retries=0,
+            ),
+        )
         try:
-            self._authorize()
+            backoff.on_exception(**self.BACKOFF_RETRY_ON_EXCEPTION_PARAMS)(
+                self._authorize
+            )()
         except AuthenticationError as e:
             _LOGGER.error("Authentication incorrect")
             raise e
@@ -66,6 +121,23 @@ class YaleAuth:
         """Return authentication headers."""
         return {"Authorization": "Bearer " + self.access_token}
 
+    def _reauthorize(self, stale_token: Optional[str]) -> None:
+        """Authorize again unless another thread already replaced stale_token."""
+        with self._auth_lock:
+            if self.access_token == stale_token:
+                self._authorize()
+
+    def _url(self, endpoint: str) -> str:
+        """Return the full url of an endpoint on the current host."""
+        url = self._urls.get(endpoint)
+        if url is None:
+            if "panic" in endpoint:
+                url = self._HOST[:-5] + endpoint
+            else:
+                url = self._HOST + endpoint
+            self._urls[endpoint] = url
+        return url
+
     @backoff.on_exception(**BACKOFF_RETRY_ON_EXCEPTION_PARAMS)
     def get_authenticated(self, endpoint: str) -> Dict[str, Any]:
         """Execute an GET request on an endpoint.
@@ -77,25 +149,39 @@ class YaleAuth:
             a dictionary with the response.
 
         """
-        url = self._HOST + endpoint
-        response = requests.get(
-            url, headers=self.auth_headers, timeout=self._DEFAULT_REQUEST_TIMEOUT
+        return self._get_authenticated(endpoint)
+
+    def _get_authenticated(self, endpoint: str) -> Dict[str, Any]:
+        """Execute a GET request without retrying, used within other requests."""
+        token = self.access_token
+        response = self.session.get(
+            self._url(endpoint),
+            headers=self.auth_headers,
+            timeout=self._DEFAULT_REQUEST_TIMEOUT,
         )
+        if response.status_code >= 500:
+            # Server errors are retried as is, a new login would not help.
+            response.raise_for_status()
         if response.status_code != 200:
-            self._authorize()
-            response = requests.get(
-                url, headers=self.auth_headers, timeout=self._DEFAULT_REQUEST_TIMEOUT
+            self._reauthorize(token)
+            response = self.session.get(
+                self._url(endpoint),
+                headers=self.auth_headers,
+                timeout=self._DEFAULT_REQUEST_TIMEOUT,
             )
             response.raise_for_status()
 
-        return cast(Dict[str, Any], response.json())
+        return cast(Dict[str, Any], _parse_json(response))
 
-    @backoff.on_exception(**BACKOFF_RETRY_ON_EXCEPTION_PARAMS)
+    @backoff.on_exception(**BACKOFF_POST_RETRY_ON_EXCEPTION_PARAMS)
     def post_authenticated(
         self, endpoint: str, params: Optional[Dict[Any, Any]] = None
     ) -> Union[Literal[True], Dict[str, Any]]:
         """Execute a POST request on an endpoint.
 
+        The request is only retried when it could not reach the server, so a
+        state change is never sent twice after a timeout or server error.
+
         Args:
             endpoint: URL endpoint to connect to.
 
@@ -103,20 +189,19 @@ class YaleAuth:
             A dictionary with the response.
 
         """
-        if "panic" in endpoint:
-            url = self._HOST[:-5] + endpoint
-        else:
-            url = self._HOST + endpoint
-        response: requests.Response = requests.post(
-            url,
+        token = self.access_token
+        response: requests.Response = self.session.post(
+            self._url(endpoint),
             headers=self.auth_headers,
             data=params,
             timeout=self._DEFAULT_REQUEST_TIMEOUT,
         )
+        if response.status_code >= 500:
+            response.raise_for_status()
         if response.status_code != 200:
-            self._authorize()
-            response = requests.post(
-                url,
+            self._reauthorize(token)
+            response = self.session.post(
+                self._url(endpoint),
                 headers=self.auth_headers,
                 data=params,
                 timeout=self._DEFAULT_REQUEST_TIMEOUT,
@@ -126,10 +211,10 @@ class YaleAuth:
         if "panic" in endpoint:
             return True
         else:
-            return cast(Dict[str, Any], response.json())
+            return cast(Dict[str, Any], _parse_json(response))
 
     def _update_services(self) -> None:
-        data = self.get_authenticated(self._ENDPOINT_SERVICES)
+        data = self._get_authenticated(self._ENDPOINT_SERVICES)
         url = data.get("yapi")
         if url is not None:
             if len(url) > 0:
@@ -137,12 +222,12 @@ class YaleAuth:
                 if url.endswith("/"):
                     url = url[:-1]
                 self._HOST = url
+                self._urls.clear()
             else:
                 _LOGGER.debug("Services URL is empty")
         else:
             _LOGGER.debug("Unable to fetch services")
 
-    @backoff.on_exception(**BACKOFF_RETRY_ON_EXCEPTION_PARAMS)
     def _authorize(self) -> Tuple[str, str]:
         if self.refresh_token:
             payload = {
@@ -158,15 +243,15 @@ class YaleAuth:
         headers = {
             "Authorization": "Basic " + self._YALE_AUTH_TOKEN,
         }
-        url = self._HOST + self._ENDPOINT_TOKEN
+        url = self._url(self._ENDPOINT_TOKEN)
 
         _LOGGER.debug("Attempting authorization")
 
-        response: requests.Response = requests.post(
+        response: requests.Response = self.session.post(
             url, headers=headers, data=payload, timeout=self._DEFAULT_REQUEST_TIMEOUT
         )
         response.raise_for_status()
-        data = response.json()
+        data = _parse_json(response)
         _LOGGER.debug(f"Authorization response: {data}")
         if data.get("error"):
             if self.refresh_token:
@@ -2,10 +2,15 @@
 
 See https://github.com/domwillcode/yale-smart-alarm-client for more information.
 """
+import copy
 import logging
-from typing import Any, Dict, cast
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple, cast
 
-from requests import RequestException
+# Raised by the client, kept importable from this module.
+from requests import RequestException  # noqa: F401
 
 from .auth import YaleAuth
 from .exceptions import AuthenticationError
@@ -17,6 +22,8 @@ YALE_STATE_ARM_FULL = "arm"
 YALE_STATE_ARM_PARTIAL = "home"
 YALE_STATE_DISARM = "disarm"
 
+_ARMED_STATES = frozenset({YALE_STATE_ARM_FULL, YALE_STATE_ARM_PARTIAL})
+
 YALE_LOCK_STATE_LOCKED = "locked"
 YALE_LOCK_STATE_UNLOCKED = "unlocked"
 YALE_LOCK_STATE_DOOR_OPEN = "dooropen"
@@ -26,10 +33,33 @@ YALE_DOOR_CONTACT_STATE_CLOSED = "closed"
 YALE_DOOR_CONTACT_STATE_OPEN = "open"
 YALE_DOOR_CONTACT_STATE_UNKNOWN = "unknown"
 
+_STATUS_NORMAL = "main.normal"
+
+# Polled (fetch time, locks, doors, armed status) of the background poller.
+_PolledState = Tuple[float, Dict[str, str], Dict[str, str], str]
+
 
 class YaleSmartAlarmClient:
     """Module for handling connection with the Yale Smart API."""
 
+    __slots__ = (
+        "_username",
+        "_password",
+        "_auth",
+        "_auth_lock",
+        "_lock_api",
+        "area_id",
+        "_cache_ttl",
+        "_cache",
+        "_generation",
+        "_snapshot_supported",
+        "_polled",
+        "_polled_lock",
+        "_poll_interval",
+        "_poll_stop",
+        "_poll_thread",
+    )
+
     YALE_CODE_RESULT_SUCCESS = "000"
 
     _ENDPOINT_GET_MODE = "/api/panel/mode/"
@@ -46,189 +76,352 @@ class YaleSmartAlarmClient:
     _REQUEST_PARAM_AREA = "area"
     _REQUEST_PARAM_MODE = "mode"
 
+    _DEVICE_TYPE_DOOR_LOCK = "device_type.door_lock"
+    _DEVICE_TYPE_DOOR_CONTACT = "device_type.door_contact"
+
+    _LOCK_STATE_MAP = {
+        "device_status.lock": YALE_LOCK_STATE_LOCKED,
+        "device_status.unlock": YALE_LOCK_STATE_UNLOCKED,
+    }
+    _DC_STATE_MAP = {
+        "device_status.dc_close": YALE_DOOR_CONTACT_STATE_CLOSED,
+        "device_status.dc_open": YALE_DOOR_CONTACT_STATE_OPEN,
+    }
+
+    # Lock state indexed by (closed << 1) | locked from minigw_lock_status.
+    _LOCK_STATE_TABLE = (
+        YALE_LOCK_STATE_DOOR_OPEN,
+        YALE_LOCK_STATE_DOOR_OPEN,
+        YALE_LOCK_STATE_UNLOCKED,
+        YALE_LOCK_STATE_LOCKED,
+    )
+
     _DEFAULT_REQUEST_TIMEOUT = 5
+    _DEFAULT_CACHE_TTL = 2.0
+    _DEFAULT_POLL_INTERVAL = 10.0
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        area_id: int = 1,
+        cache_ttl: float = _DEFAULT_CACHE_TTL,
+        lazy_login: bool = False,
+    ) -> None:
+        """Initialize module.
 
-    def __init__(self, username: str, password: str, area_id: int = 1) -> None:
-        """Initialize module."""
-        self.auth: YaleAuth = YaleAuth(username=username, password=password)
+        Arguments:
+            cache_ttl: Seconds a status response is reused for, 0 disables caching.
+            lazy_login: Postpone authentication until the first API call.
+        """
+        self._username = username
+        self._password = password
+        self._auth: Optional[YaleAuth] = None
+        self._auth_lock = threading.Lock()
+        self._lock_api: Optional[YaleDoorManAPI] = None
         self.area_id = area_id
-        self.lock_api: YaleDoorManAPI = YaleDoorManAPI(auth=self.auth)
+        self._cache_ttl = cache_ttl
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # Bumped on every panel state change, fetches started before it are stale.
+        self._generation = 0
+        self._snapshot_supported: Optional[bool] = None
+        self._polled: Optional[_PolledState] = None
+        self._polled_lock = threading.Lock()
+        self._poll_interval = self._DEFAULT_POLL_INTERVAL
+        self._poll_stop: Optional[threading.Event] = None
+        self._poll_thread: Optional[threading.Thread] = None
+        if not lazy_login:
+            # Authenticate now so invalid credentials raise from the constructor.
+            self._auth = YaleAuth(username=username, password=password)
+
+    @property
+    def auth(self) -> YaleAuth:
+        """Return the authentication module, logging in on first use."""
+        if self._auth is None:
+            # The poller thread may race the caller to the first login.
+            with self._auth_lock:
+                if self._auth is None:
+                    self._auth = YaleAuth(
+                        username=self._username, password=self._password
+                    )
+        return self._auth
+
+    @property
+    def lock_api(self) -> YaleDoorManAPI:
+        """Return the lock api, created on first use."""
+        if self._lock_api is None:
+            self._lock_api = YaleDoorManAPI(auth=self.auth)
+        return self._lock_api
+
+    def _get_cached(self, endpoint: str) -> Dict[str, Any]:
+        """Return the response of endpoint, reusing a recent one if still valid.
+
+        The returned dict is shared with the cache and must not be modified.
+        """
+        now = time.monotonic()
+        cached = self._cache.get(endpoint)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        generation = self._generation
+        response = self.auth.get_authenticated(endpoint)
+        with self._polled_lock:
+            # Don't cache a response fetched before the panel state changed.
+            if generation == self._generation:
+                self._cache[endpoint] = (now + self._cache_ttl, response)
+        return response
+
+    def _invalidate_cache(self) -> None:
+        """Drop all cached responses, called after changing the panel state."""
+        with self._polled_lock:
+            self._generation += 1
+            self._cache.clear()
+            self._polled = None
+
+    def start_polling(self, interval: float = _DEFAULT_POLL_INTERVAL) -> None:
+        """Poll the locks, doors and armed status on a background thread.
+
+        While polling, get_locks_status, get_doors_status, get_armed_status and
+        is_armed return the last polled state instead of calling the API. When
+        no poll succeeded for two intervals they call the API again, so an
+        outage raises instead of serving an outdated state.
+
+        Arguments:
+            interval: Seconds between two polls.
+        """
+        if self._poll_thread is not None:
+            return
+        self._poll_interval = interval
+        self._poll_stop = threading.Event()
+        self._poll_thread = threading.Thread(
+            target=self._poll,
+            args=(interval, self._poll_stop),
+            name="yalesmartalarmclient-poll",
+            daemon=True,
+        )
+        self._poll_thread.start()
+
+    def stop_polling(self) -> None:
+        """Stop the background polling and return to calling the API directly."""
+        if self._poll_thread is None or self._poll_stop is None:
+            return
+        self._poll_stop.set()
+        self._poll_thread.join()
+        self._poll_thread = None
+        self._poll_stop = None
+        with self._polled_lock:
+            self._polled = None
+
+    def _poll(self, interval: float, stop: threading.Event) -> None:
+        """Refresh the polled state every interval seconds until stop is set."""
+        while not stop.is_set():
+            fetched = time.monotonic()
+            generation = self._generation
+            try:
+                locks, doors = self.refresh()
+                mode = self._fetch_armed_status()
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Failed to poll the Yale Smart Alarm API")
+            else:
+                with self._polled_lock:
+                    # Drop the result if the panel state changed while fetching.
+                    if generation == self._generation:
+                        self._polled = (fetched, locks, doors, mode)
+            stop.wait(interval)
+
+    def _get_polled(self) -> Optional[_PolledState]:
+        """Return the last polled state, or None if missing or outdated."""
+        with self._polled_lock:
+            polled = self._polled
+        if polled is None or time.monotonic() - polled[0] > 2 * self._poll_interval:
+            return None
+        return polled
 
     def get_all(self) -> str:
         """DEBUG function to get full visibility from API for local testing, use with print()."""
-        try:
-            devices = self.auth.get_authenticated(self._ENDPOINT_DEVICES_STATUS)
-            mode = self.auth.get_authenticated(self._ENDPOINT_GET_MODE)
-            status = self.auth.get_authenticated(self._ENDPOINT_STATUS)
-            cycle = self.auth.get_authenticated(self._ENDPOINT_CYCLE)
-            online = self.auth.get_authenticated(self._ENDPOINT_ONLINE)
-            history = self.auth.get_authenticated(self._ENDPOINT_HISTORY)
-            panel_info = self.auth.get_authenticated(self._ENDPOINT_PANEL_INFO)
-            auth_check = self.auth.get_authenticated(self._ENDPOINT_CHECK)
-        except AuthenticationError as e:
-            raise e
-        except RequestException as e:
-            raise e
-
-        return (
-            " DEVICES \n"
-            + str(devices["data"])
-            + "\n MODE \n"
-            + str(mode["data"])
-            + "\n STATUS \n"
-            + str(status["data"])
-            + "\n CYCLE \n"
-            + str(cycle["data"])
-            + "\n ONLINE \n"
-            + str(online["data"])
-            + "\n HISTORY \n"
-            + str(history["data"])
-            + "\n PANEL INFO \n"
-            + str(panel_info["data"])
-            + "\n AUTH CHECK \n"
-            + str(auth_check["data"])
+        sections = (
+            ("DEVICES", self._ENDPOINT_DEVICES_STATUS),
+            ("MODE", self._ENDPOINT_GET_MODE),
+            ("STATUS", self._ENDPOINT_STATUS),
+            ("CYCLE", self._ENDPOINT_CYCLE),
+            ("ONLINE", self._ENDPOINT_ONLINE),
+            ("HISTORY", self._ENDPOINT_HISTORY),
+            ("PANEL INFO", self._ENDPOINT_PANEL_INFO),
+            ("AUTH CHECK", self._ENDPOINT_CHECK),
         )
+        # The endpoints are independent, fetch them concurrently so the total
+        # time is bound by the slowest request instead of the sum of all.
+        with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+            responses = executor.map(
+                self.auth.get_authenticated, [endpoint for _, endpoint in sections]
+            )
+            return "\n".join(
+                f" {name} \n{response['data']}"
+                for (name, _), response in zip(sections, responses)
+            )
 
     def get_all_devices(self) -> Dict[str, Any]:
         """Return full json for all devices."""
-        try:
-            devices = self.auth.get_authenticated(self._ENDPOINT_DEVICES_STATUS)
-        except AuthenticationError as e:
-            raise e
-        except RequestException as e:
-            raise e
-        return cast(Dict[str, Any], devices["data"])
+        devices = self._get_cached(self._ENDPOINT_DEVICES_STATUS)
+        return cast(Dict[str, Any], copy.deepcopy(devices["data"]))
 
     def get_cycle(self) -> Dict[str, Any]:
         """Return full cycle."""
-        try:
-            cycle = self.auth.get_authenticated(self._ENDPOINT_CYCLE)
-        except AuthenticationError as e:
-            raise e
-        except RequestException as e:
-            raise e
+        cycle = self.auth.get_authenticated(self._ENDPOINT_CYCLE)
         return cast(Dict[str, Any], cycle["data"])
 
     def get_status(self) -> str:
         """Return status from system."""
-        try:
-            status = self.auth.get_authenticated(self._ENDPOINT_STATUS)
-        except AuthenticationError as e:
-            raise e
-        except RequestException as e:
-            raise e
-        acfail = status["data"]["acfail"]
-        battery = status["data"]["battery"]
-        tamper = status["data"]["tamper"]
-        jam = status["data"]["jam"]
-        if acfail == battery == tamper == jam == "main.normal":
+        status = self._get_cached(self._ENDPOINT_STATUS)
+        data = status["data"]
+        acfail = data["acfail"]
+        battery = data["battery"]
+        tamper = data["tamper"]
+        jam = data["jam"]
+        if acfail == battery == tamper == jam == _STATUS_NORMAL:
             return "ok"
         return "error"
 
     def get_online(self) -> Dict[str, Any]:
         """Return available from system."""
-        try:
-            online = self.auth.get_authenticated(self._ENDPOINT_ONLINE)
-        except AuthenticationError as e:
-            raise e
-        except RequestException as e:
-            raise e
+        online = self.auth.get_authenticated(self._ENDPOINT_ONLINE)
         return cast(Dict[str, Any], online["data"])
 
     def get_panel_info(self) -> Dict[str, Any]:
         """Return panel information."""
-        try:
-            panel_info = self.auth.get_authenticated(self._ENDPOINT_PANEL_INFO)
-        except AuthenticationError as e:
-            raise e
-        except RequestException as e:
-            raise e
+        panel_info = self.auth.get_authenticated(self._ENDPOINT_PANEL_INFO)
         return cast(Dict[str, Any], panel_info["data"])
 
     def get_history(self) -> Dict[str, Any]:
         """Return the log from the system."""
-        try:
-            history = self.auth.get_authenticated(self._ENDPOINT_HISTORY)
-        except AuthenticationError as e:
-            raise e
-        except RequestException as e:
-            raise e
+        history = self.auth.get_authenticated(self._ENDPOINT_HISTORY)
         return cast(Dict[str, Any], history["data"])
 
     def get_auth_check(self) -> Dict[str, Any]:
         """Return the authorization check."""
-        try:
-            check = self.auth.get_authenticated(self._ENDPOINT_CHECK)
-        except AuthenticationError as e:
-            raise e
-        except RequestException as e:
-            raise e
+        check = self.auth.get_authenticated(self._ENDPOINT_CHECK)
         return cast(Dict[str, Any], check["data"])
 
-    def get_locks_status(self) -> Dict[str, str]:
-        """Return all locks status from the system."""
+    def _get_cycle_snapshot(self) -> Optional[Dict[str, Any]]:
+        """Return the cycle data if it bundles device status and mode, else None."""
+        if self._snapshot_supported is False:
+            return None
         try:
-            devices = self.auth.get_authenticated(self._ENDPOINT_DEVICES_STATUS)
+            cycle = self._get_cached(self._ENDPOINT_CYCLE).get("data")
         except AuthenticationError as e:
-            raise e
-        except RequestException as e:
-            raise e
+            if self._snapshot_supported is not None:
+                raise
+            # The panel refused the cycle endpoint, use the separate ones. Transient
+            # errors propagate instead and leave the probe to the next call.
+            _LOGGER.debug("Panel snapshot unavailable: %s", e)
+            self._snapshot_supported = False
+            return None
+        if self._snapshot_supported is None:
+            self._snapshot_supported = isinstance(cycle, dict) and all(
+                isinstance(cycle.get(key), list) for key in ("device_status", "mode")
+            )
+            _LOGGER.debug("Panel snapshot supported: %s", self._snapshot_supported)
+        return cast(Dict[str, Any], cycle) if self._snapshot_supported else None
+
+    def _get_panel_data(self, key: str, endpoint: str) -> Any:
+        """Return key from the cycle snapshot, or the data of endpoint without one."""
+        cycle = self._get_cycle_snapshot()
+        if cycle is not None:
+            return cycle[key]
+        return self._get_cached(endpoint)["data"]
+
+    def get_panel_snapshot(self) -> Dict[str, Any]:
+        """Return the device status and mode data of the panel.
+
+        The cycle endpoint bundles both on panels that support it, which saves a
+        request per poll. Otherwise the device status and mode endpoints are used.
+        """
+        return copy.deepcopy(
+            {
+                "device_status": self._get_panel_data(
+                    "device_status", self._ENDPOINT_DEVICES_STATUS
+                ),
+                "mode": self._get_panel_data("mode", self._ENDPOINT_GET_MODE),
+            }
+        )
+
+    @staticmethod
+    def _map_device_status(status: str, states: Dict[str, str], default: str) -> str:
+        """Map a device status1 value to a state.
+
+        status1 is usually a single status, which is a plain dict lookup. Values
+        carrying several statuses fall back to a substring scan in map order.
+        """
+        state = states.get(status)
+        if state is not None:
+            return state
+        for device_status, state in states.items():
+            if device_status in status:
+                return state
+        return default
+
+    def refresh(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Return the locks and door contacts status from a single device fetch."""
+        devices = self._get_panel_data("device_status", self._ENDPOINT_DEVICES_STATUS)
         locks: Dict[str, str] = {}
-        for device in devices["data"]:
-            if device["type"] == "device_type.door_lock":
-                state = device["status1"]
-                name = device["name"]
-                lock_status_str = device["minigw_lock_status"]
+        doors: Dict[str, str] = {}
+        for device in devices:
+            device_type = device.get("type")
+            if device_type not in (
+                self._DEVICE_TYPE_DOOR_LOCK,
+                self._DEVICE_TYPE_DOOR_CONTACT,
+            ):
+                continue
+            name = device.get("name")
+            if not name:
+                _LOGGER.debug("Skipping %s device without a name", device_type)
+                continue
+            if device_type == self._DEVICE_TYPE_DOOR_LOCK:
+                lock_status_str = device.get("minigw_lock_status", "")
                 if lock_status_str != "":
                     lock_status = int(lock_status_str, 16)
-                    closed = (lock_status & 16) == 16
-                    locked = (lock_status & 1) == 1
-                    if closed is True and locked is True:
-                        state = YALE_LOCK_STATE_LOCKED
-                    elif closed is True and locked is False:
-                        state = YALE_LOCK_STATE_UNLOCKED
-                    elif not closed:
-                        state = YALE_LOCK_STATE_DOOR_OPEN
-                elif "device_status.lock" in state:
-                    state = YALE_LOCK_STATE_LOCKED
-                elif "device_status.unlock" in state:
-                    state = YALE_LOCK_STATE_UNLOCKED
+                    state = self._LOCK_STATE_TABLE[
+                        ((lock_status >> 4) & 1) << 1 | (lock_status & 1)
+                    ]
                 else:
-                    state = YALE_LOCK_STATE_UNKNOWN
+                    state = self._map_device_status(
+                        device.get("status1", ""),
+                        self._LOCK_STATE_MAP,
+                        YALE_LOCK_STATE_UNKNOWN,
+                    )
                 locks[name] = state
-        return locks
+            else:
+                doors[name] = self._map_device_status(
+                    device.get("status1", ""),
+                    self._DC_STATE_MAP,
+                    YALE_DOOR_CONTACT_STATE_UNKNOWN,
+                )
+        return locks, doors
+
+    def get_locks_status(self) -> Dict[str, str]:
+        """Return all locks status from the system."""
+        polled = self._get_polled()
+        if polled is not None:
+            return dict(polled[1])
+        return self.refresh()[0]
 
     def get_doors_status(self) -> Dict[str, str]:
         """Return all door contacts status from the system."""
-        try:
-            devices = self.auth.get_authenticated(self._ENDPOINT_DEVICES_STATUS)
-        except AuthenticationError as e:
-            raise e
-        except RequestException as e:
-            raise e
-        doors: Dict[str, str] = {}
-        for device in devices["data"]:
-            if device["type"] == "device_type.door_contact":
-                state = device["status1"]
-                name = device["name"]
-                if "device_status.dc_close" in state:
-                    state = YALE_DOOR_CONTACT_STATE_CLOSED
-                elif "device_status.dc_open" in state:
-                    state = YALE_DOOR_CONTACT_STATE_OPEN
-                else:
-                    state = YALE_DOOR_CONTACT_STATE_UNKNOWN
-                doors[name] = state
-        return doors
+        polled = self._get_polled()
+        if polled is not None:
+            return dict(polled[2])
+        return self.refresh()[1]
+
+    def _fetch_armed_status(self) -> str:
+        """Fetch the armed status from the API."""
+        alarm_state = self._get_panel_data("mode", self._ENDPOINT_GET_MODE)
+        return cast(str, alarm_state[0].get("mode"))
 
     def get_armed_status(self) -> str:
         """Get armed status."""
-        try:
-            alarm_state = self.auth.get_authenticated(self._ENDPOINT_GET_MODE)
-        except AuthenticationError as e:
-            raise e
-        except RequestException as e:
-            raise e
-        return cast(str, alarm_state.get("data")[0].get("mode"))
+        polled = self._get_polled()
+        if polled is not None:
+            return polled[3]
+        return self._fetch_armed_status()
 
     def set_armed_status(self, mode: str) -> Dict[str, Any]:
         """Set armed status.
@@ -248,60 +441,28 @@ class YaleSmartAlarmClient:
                 Dict[str, Any],
                 self.auth.post_authenticated(self._ENDPOINT_SET_MODE, params=params),
             )
-        except AuthenticationError as e:
-            raise e
-        except RequestException as e:
-            raise e
+        finally:
+            self._invalidate_cache()
 
     def trigger_panic_button(self) -> None:
         """Trigger the alarm via the panic function."""
         try:
             self.auth.post_authenticated(self._ENDPOINT_PANIC_BUTTON)
-        except AuthenticationError as e:
-            raise e
-        except RequestException as e:
-            raise e
+        finally:
+            self._invalidate_cache()
 
     def arm_full(self) -> None:
         """Arm away."""
-        try:
-            self.set_armed_status(YALE_STATE_ARM_FULL)
-        except AuthenticationError as e:
-            raise e
-        except RequestException as e:
-            raise e
+        self.set_armed_status(YALE_STATE_ARM_FULL)
 
     def arm_partial(self) -> None:
         """Arm home."""
-        try:
-            self.set_armed_status(YALE_STATE_ARM_PARTIAL)
-        except AuthenticationError as e:
-            raise e
-        except RequestException as e:
-            raise e
+        self.set_armed_status(YALE_STATE_ARM_PARTIAL)
 
     def disarm(self) -> None:
         """Disarm alarm."""
-        try:
-            self.set_armed_status(YALE_STATE_DISARM)
-        except AuthenticationError as e:
-            raise e
-        except RequestException as e:
-            raise e
+        self.set_armed_status(YALE_STATE_DISARM)
 
     def is_armed(self) -> bool:
         """Return True or False if the system is armed in any way."""
-        try:
-            alarm_code = self.get_armed_status()
-        except AuthenticationError as e:
-            raise e
-        except RequestException as e:
-            raise e
-
-        if alarm_code == YALE_STATE_ARM_FULL:
-            return True
-
-        if alarm_code == YALE_STATE_ARM_PARTIAL:
-            return True
-
-        return False
+        return self.get_armed_status() in _ARMED_STATES
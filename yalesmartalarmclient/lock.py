@@ -3,10 +3,6 @@
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, cast
 
-from requests import RequestException
-
-from .exceptions import AuthenticationError
-
 if TYPE_CHECKING:
     from .auth import YaleAuth
 
@@ -20,6 +16,15 @@ class YaleLockState(Enum):
     UNKNOWN = 4
 
 
+# Lock state indexed by (closed << 1) | locked from minigw_lock_status.
+_LOCK_STATE_TABLE = (
+    YaleLockState.DOOR_OPEN,
+    YaleLockState.DOOR_OPEN,
+    YaleLockState.UNLOCKED,
+    YaleLockState.LOCKED,
+)
+
+
 class YaleLock:
     """This is an abstraction of a remove Yale lock.
 
@@ -88,16 +93,9 @@ class YaleLock:
         lock_status_str = self._device["minigw_lock_status"]
         if lock_status_str != "":
             lock_status = int(lock_status_str, 16)
-            closed = (lock_status & 16) == 16
-            locked = (lock_status & 1) == 1
-            if closed is True and locked is True:
-                state = YaleLockState.LOCKED
-            elif closed is True and locked is False:
-                state = YaleLockState.UNLOCKED
-            elif not closed:
-                state = YaleLockState.DOOR_OPEN
-            else:
-                state = YaleLockState.UNKNOWN
+            state = _LOCK_STATE_TABLE[
+                ((lock_status >> 4) & 1) << 1 | (lock_status & 1)
+            ]
         elif "device_status.lock" in raw_state:
             state = YaleLockState.LOCKED
         elif "device_status.unlock" in raw_state:
@@ -111,24 +109,14 @@ class YaleLock:
 
         Returns: True if the API returns success.
         """
-        try:
-            return self._lock_api.close_lock(lock=self)
-        except AuthenticationError as e:
-            raise e
-        except RequestException as e:
-            raise e
+        return self._lock_api.close_lock(lock=self)
 
     def open(self, pin_code: str) -> bool:
         """Attempt to open the lock.
 
         returns: True if the lock was opened.
         """
-        try:
-            return self._lock_api.open_lock(lock=self, pin_code=pin_code)
-        except AuthenticationError as e:
-            raise e
-        except RequestException as e:
-            raise e
+        return self._lock_api.open_lock(lock=self, pin_code=pin_code)
 
 
 class YaleDoorManAPI:
@@ -183,12 +171,7 @@ class YaleDoorManAPI:
             >>>     print(lock)
             myfrontdoor [YaleLockState.UNLOCKED]
         """
-        try:
-            devices = self.auth.get_authenticated(self._ENDPOINT_DEVICES_STATUS)
-        except AuthenticationError as e:
-            raise e
-        except RequestException as e:
-            raise e
+        devices = self.auth.get_authenticated(self._ENDPOINT_DEVICES_STATUS)
         for device in devices["data"]:
             if device["type"] == YaleLock.DEVICE_TYPE:
                 lock = YaleLock(device, lock_api=self)
@@ -244,14 +227,9 @@ class YaleDoorManAPI:
             "device_type": lock.device_type(),
             "request_value": "1",
         }
-        try:
-            operation_status = self.auth.post_authenticated(
-                self._ENDPOINT_DEVICES_CONTROL, params=params
-            )
-        except AuthenticationError as e:
-            raise e
-        except RequestException as e:
-            raise e
+        operation_status = self.auth.post_authenticated(
+            self._ENDPOINT_DEVICES_CONTROL, params=params
+        )
 
         success: bool = operation_status["code"] == self.CODE_SUCCESS
         if success:
@@ -283,14 +261,9 @@ class YaleDoorManAPI:
             myfrontdoor [YaleLockState.UNLOCKED]
         """
         params = {"area": lock.area(), "zone": lock.zone(), "pincode": pin_code}
-        try:
-            operation_status = self.auth.post_authenticated(
-                self._ENDPOINT_DEVICES_UNLOCK, params=params
-            )
-        except AuthenticationError as e:
-            raise e
-        except RequestException as e:
-            raise e
+        operation_status = self.auth.post_authenticated(
+            self._ENDPOINT_DEVICES_UNLOCK, params=params
+        )
         success: bool = operation_status["code"] == self.CODE_SUCCESS
         if success:
             lock.set_state(YaleLockState.UNLOCKED)